@@ -1,6 +1,9 @@
 """Meeting Assistant - Streamlit UI Application."""
 
-import shutil
+import hashlib
+import io
+import sqlite3
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 
@@ -10,24 +13,24 @@ from meeting_assistant import __app_name__, __version__
 from meeting_assistant.database import Meeting, MeetingDatabase
 from meeting_assistant.exporter import MeetingExporter
 from meeting_assistant.summarizer import Summarizer
-from meeting_assistant.transcriber import Transcriber
+from meeting_assistant.transcriber import SAMPLE_RATE, Transcriber
 
 # --- Configuration ---
 UPLOADS_DIR = Path("uploads")
 UPLOADS_DIR.mkdir(exist_ok=True)
 
-SAMPLE_RATE = 16000
-
-
-def _check_ffmpeg() -> bool:
-    """Check if FFmpeg is installed and available."""
-    return shutil.which("ffmpeg") is not None
+# Block size for writing audio to disk
+IO_CHUNK_SIZE = 2 * 1024 * 1024  # 2 MiB
 
 
 # --- Initialize Services (cached) ---
-@st.cache_resource
+@st.cache_resource(show_spinner="Loading Whisper model...")
 def get_transcriber() -> Transcriber:
-    return Transcriber()
+    transcriber = Transcriber()
+    # Load the weights now, once per process, rather than on the first
+    # transcription; the cached instance then owns the only copy on the device.
+    _ = transcriber.pipeline
+    return transcriber
 
 
 @st.cache_resource
@@ -45,6 +48,56 @@ def get_exporter() -> MeetingExporter:
     return MeetingExporter()
 
 
+@st.cache_resource
+def get_io_pool() -> ThreadPoolExecutor:
+    return ThreadPoolExecutor(max_workers=1, thread_name_prefix="audio-io")
+
+
+def _save_bytes(path: Path, data: bytes, chunk_size: int = IO_CHUNK_SIZE) -> Path:
+    """Write data to path in chunk_size blocks."""
+    view = memoryview(data)
+    with open(path, "wb", buffering=chunk_size) as f:
+        for start in range(0, len(view), chunk_size):
+            f.write(view[start:start + chunk_size])
+    return path
+
+
+def _discard_saved(saved: Future) -> None:
+    """Cancel a background _save_bytes write, or remove the file it wrote."""
+    if saved.cancel():
+        return
+    try:
+        saved.result().unlink(missing_ok=True)
+    except OSError:
+        pass  # the write itself failed, so there is nothing to remove
+
+
+@st.cache_data(show_spinner=False)
+def _summarize(transcript: str) -> dict:
+    """Run the LLM pipeline, memoized per transcript within this process."""
+    return get_summarizer().process_meeting(transcript)
+
+
+def _db_version(db_path: Path) -> tuple:
+    """Modification stamp of the database file and its WAL sidecar.
+
+    In WAL mode commits land in the -wal file, so the main file's mtime
+    alone does not change on every save or delete.
+    """
+    stamps = []
+    for path in (db_path, db_path.with_name(db_path.name + "-wal")):
+        if path.exists():
+            stat = path.stat()
+            stamps.append((stat.st_mtime_ns, stat.st_size))
+    return tuple(stamps)
+
+
+@st.cache_data(show_spinner=False)
+def _cached_meeting_summaries(db_version: tuple, db_path: str) -> list[tuple[int, str]]:
+    """List (id, title) for the sidebar; re-queried only when the DB changes."""
+    return get_database().list_meeting_summaries()
+
+
 # --- Session State Initialization ---
 def init_session_state() -> None:
     """Initialize all session state variables."""
@@ -52,12 +105,34 @@ def init_session_state() -> None:
         "transcript": "",
         "current_meeting": None,
         "processing": False,
+        "pending_deletes": [],
+        "notice": None,
     }
     for key, value in defaults.items():
         if key not in st.session_state:
             st.session_state[key] = value
 
 
+def _queue_delete(meeting_id: int) -> None:
+    """Delete-button callback: queue the meeting for the next flush."""
+    st.session_state.pending_deletes.append(meeting_id)
+
+
+def _flush_pending_deletes(db: MeetingDatabase) -> None:
+    """Delete all queued meetings in one transaction and remove their audio."""
+    if not st.session_state.pending_deletes:
+        return
+    deleted = db.delete_meetings(st.session_state.pending_deletes)
+    st.session_state.pending_deletes = []
+
+    for audio_path in deleted.values():
+        if audio_path and Path(audio_path).exists():
+            Path(audio_path).unlink()
+    current = st.session_state.current_meeting
+    if current and current.id in deleted:
+        st.session_state.current_meeting = None
+
+
 # --- Main App ---
 def main() -> None:
     """Main application entry point."""
@@ -70,6 +145,12 @@ def main() -> None:
     init_session_state()
     db = get_database()
 
+    # Toasts raised just before st.rerun() would be lost, so they are
+    # queued in session state and shown on the following run.
+    if st.session_state.notice:
+        st.toast(st.session_state.notice)
+        st.session_state.notice = None
+
     # --- Header ---
     st.title(__app_name__)
     st.caption(f"v{__version__} — AI-powered meeting notes generator")
@@ -82,44 +163,36 @@ def main() -> None:
         )
         st.stop()
 
-    if not _check_ffmpeg():
-        st.error(
-            "**FFmpeg not found!** Whisper requires FFmpeg to process audio.\n\n"
-            "Install it:\n"
-            "- **Windows:** `winget install ffmpeg`\n"
-            "- **Mac:** `brew install ffmpeg`\n"
-            "- **Linux:** `sudo apt install ffmpeg`\n\n"
-            "Then restart this app."
-        )
-        st.stop()
+    get_transcriber()  # warm the model before the first recording
 
     # --- Sidebar: Meeting History ---
     with st.sidebar:
         st.header("Meeting History")
-        meetings = db.get_all_meetings()
+        # Button callbacks run before this rerun, so every delete clicked
+        # since the last run is committed together before listing.
+        _flush_pending_deletes(db)
+        meetings = _cached_meeting_summaries(
+            _db_version(db.db_path), str(db.db_path))
 
         if meetings:
-            for meeting in meetings:
+            for meeting_id, title in meetings:
                 col1, col2 = st.columns([4, 1])
                 with col1:
                     if st.button(
-                        meeting.title,
-                        key=f"meeting_{meeting.id}",
+                        title,
+                        key=f"meeting_{meeting_id}",
                         use_container_width=True,
                     ):
-                        st.session_state.current_meeting = meeting
+                        # Load the full record only for the selected meeting
+                        st.session_state.current_meeting = db.get_meeting(
+                            meeting_id)
                 with col2:
-                    if st.button("🗑️", key=f"delete_{meeting.id}"):
-                        if meeting.id is not None:
-                            audio_path = db.delete_meeting(meeting.id)
-                            if audio_path and Path(audio_path).exists():
-                                Path(audio_path).unlink()
-                        if (
-                            st.session_state.current_meeting
-                            and st.session_state.current_meeting.id == meeting.id
-                        ):
-                            st.session_state.current_meeting = None
-                        st.rerun()
+                    st.button(
+                        "🗑️",
+                        key=f"delete_{meeting_id}",
+                        on_click=_queue_delete,
+                        args=(meeting_id,),
+                    )
         else:
             st.info("No meetings yet. Record or upload one!")
 
@@ -148,12 +221,8 @@ def main() -> None:
                 st.audio(audio_bytes, format="audio/wav")
 
                 if st.button("Process Recording", type="primary"):
-                    # Save audio bytes to file
                     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                    audio_path = UPLOADS_DIR / f"recording_{timestamp}.wav"
-                    with open(audio_path, "wb") as f:
-                        f.write(audio_bytes)
-                    _process_audio(str(audio_path))
+                    _process_audio(f"recording_{timestamp}.wav", audio_bytes)
             elif audio_bytes:
                 st.warning("Recording is too short. Please try again.")
 
@@ -175,15 +244,11 @@ def main() -> None:
         )
 
         if uploaded_file is not None:
-            # Save uploaded file
-            audio_path = UPLOADS_DIR / uploaded_file.name
-            with open(audio_path, "wb") as f:
-                f.write(uploaded_file.getbuffer())
             st.success(f"Uploaded: {uploaded_file.name}")
             st.audio(uploaded_file)
 
             if st.button("Process Audio", type="primary"):
-                _process_audio(str(audio_path))
+                _process_audio(uploaded_file.name, uploaded_file.getvalue())
 
     # --- Tab 3: View Meeting ---
     with tab_view:
@@ -194,56 +259,100 @@ def main() -> None:
             _display_meeting(meeting)
 
 
-def _process_audio(audio_path: str) -> None:
-    """Transcribe and summarize an audio file."""
+def _audio_hash(data: bytes) -> str:
+    """Return a short content hash identifying an audio file."""
+    return hashlib.blake2b(data, digest_size=8).hexdigest()
+
+
+def _open_existing(existing: Meeting) -> None:
+    """Select the meeting already transcribed from the same audio."""
+    st.session_state.current_meeting = existing
+    st.session_state.notice = (
+        f"This audio was already processed as \"{existing.title}\".")
+
+
+def _process_audio(filename: str, audio_bytes: bytes) -> None:
+    """Save, transcribe and summarize recorded or uploaded audio."""
     transcriber = get_transcriber()
-    summarizer = get_summarizer()
     db = get_database()
 
+    # Re-uploading the same audio opens the existing meeting instead of
+    # paying for transcription and summarization again.
+    audio_hash = _audio_hash(audio_bytes)
+    existing = db.get_meeting_by_hash(audio_hash)
+    if existing is not None:
+        _open_existing(existing)
+        st.rerun()
+
+    audio_path = UPLOADS_DIR / f"{audio_hash}_{filename}"
+
+    # Write the file in the background, only once the audio is known to be
+    # new; the pipeline decodes from memory. Early exits discard the file.
+    saved = get_io_pool().submit(_save_bytes, audio_path, audio_bytes)
+
     with st.status("Processing meeting...", expanded=True) as status:
-        # Step 1: Check audio duration
-        import soundfile as sf
+        # Step 1: Decode once and check audio duration
         try:
-            audio_info = sf.info(audio_path)
-            if audio_info.duration < 1.0:
-                status.update(label="Audio too short", state="error")
-                st.warning(
-                    "Recording is too short (less than 1 second). Please record a longer clip.")
-                return
-        except Exception:
-            pass  # Let Whisper handle any file issues
-
-        # Step 2: Transcribe
+            audio = transcriber.load_audio(io.BytesIO(audio_bytes))
+        except Exception as e:
+            status.update(label="Could not read audio", state="error")
+            st.error(f"Could not decode the audio file: {e}")
+            _discard_saved(saved)
+            return
+
+        if len(audio) / SAMPLE_RATE < 1.0:
+            status.update(label="Audio too short", state="error")
+            st.warning(
+                "Recording is too short (less than 1 second). Please record a longer clip.")
+            _discard_saved(saved)
+            return
+
+        # Step 2: Transcribe the decoded waveform
         st.write("Transcribing audio with Whisper...")
-        result = transcriber.transcribe_file(audio_path)
+        result = transcriber.transcribe_array(audio)
         transcript = result["text"]
 
         if not transcript.strip():
             status.update(label="No speech detected", state="error")
             st.warning(
                 "Could not detect any speech in the audio. Please try again.")
+            _discard_saved(saved)
             return
 
         st.write(f"Transcribed ({len(transcript.split())} words)")
 
         # Step 2: Summarize
         st.write("Generating summary with AI...")
-        ai_result = summarizer.process_meeting(transcript)
+        ai_result = _summarize(transcript)
         st.write("Summary generated")
 
         # Step 3: Save
         st.write("Saving meeting...")
+        saved.result()  # the audio file must exist before it is referenced
         meeting = Meeting(
             title=ai_result["title"],
             transcript=transcript,
             summary=ai_result["summary"],
             key_points=ai_result["key_points"],
             action_items=ai_result["action_items"],
-            audio_path=audio_path,
+            audio_path=str(audio_path),
+            audio_hash=audio_hash,
         )
-        db.save_meeting(meeting)
-        st.session_state.current_meeting = meeting
-        status.update(label="Meeting processed!", state="complete")
+        try:
+            db.save_meeting(meeting)
+        except sqlite3.IntegrityError:
+            # Another session saved the same audio while this one was
+            # processing it; keep theirs.
+            existing = db.get_meeting_by_hash(audio_hash)
+            if existing is None:
+                raise
+            if existing.audio_path != meeting.audio_path:
+                audio_path.unlink(missing_ok=True)
+            _open_existing(existing)
+            status.update(label="Meeting already processed", state="complete")
+        else:
+            st.session_state.current_meeting = meeting
+            status.update(label="Meeting processed!", state="complete")
 
     st.rerun()
 
@@ -287,9 +396,7 @@ def _display_meeting(meeting: Meeting) -> None:
     question = st.text_input("Ask a question about the meeting...")
     if question:
         summarizer = get_summarizer()
-        with st.spinner("Thinking..."):
-            answer = summarizer.answer_question(meeting.transcript, question)
-        st.write(answer)
+        st.write_stream(summarizer.stream_answer(meeting.transcript, question))
 
     # Full Transcript (expandable)
     with st.expander("Full Transcript"):
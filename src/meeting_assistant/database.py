@@ -1,12 +1,106 @@
 """Database module for storing and retrieving meeting records."""
 
-import json
+import os
+import queue
+import re
 import sqlite3
+import threading
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Iterable, Iterator, NamedTuple, Optional, Sequence, Union
+from urllib.parse import parse_qs, urlsplit
 
 from pydantic import BaseModel, Field
+from pydantic_core import from_json, to_json
+
+from meeting_assistant.stop_words import STOP_WORDS
+
+# Rows converted per fetchmany() call when reading meetings
+FETCH_BATCH_SIZE = 1000
+
+# save_meetings() batches larger than this refresh the planner statistics
+ANALYZE_THRESHOLD = 1000
+
+# The FTS5 trigram tokenizer first shipped in SQLite 3.34
+MIN_SQLITE_VERSION = (3, 34, 0)
+
+# Applied to every connection. busy_timeout waits out other writers rather
+# than failing with "database is locked"; cache_size is in KiB when negative.
+_PRAGMAS = """
+    PRAGMA synchronous=NORMAL;
+    PRAGMA busy_timeout=5000;
+    PRAGMA temp_store=MEMORY;
+    PRAGMA cache_size=-64000;
+"""
+
+# Statements are kept as constants so each one is compiled once and then
+# served from the connection's statement cache, which is keyed by SQL text.
+_SQL_INSERT = """
+    INSERT INTO meetings (title, date, transcript, summary, key_points, action_items, audio_path, audio_hash)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+"""
+_SQL_UPDATE = """
+    UPDATE meetings
+    SET title=?, date=?, transcript=?, summary=?, key_points=?, action_items=?, audio_path=?, audio_hash=?
+    WHERE id=?
+"""
+# Selected by name so _MeetingRow.from_db can unpack rows by position
+_MEETING_COLUMNS = ("id, title, date, transcript, summary, key_points, action_items,"
+                    " audio_path, audio_hash")
+_SQL_SELECT_ONE = f"SELECT {_MEETING_COLUMNS} FROM meetings WHERE id = ?"
+_SQL_SELECT_BY_HASH = f"SELECT {_MEETING_COLUMNS} FROM meetings WHERE audio_hash = ?"
+# Ties on date are broken by id, the order idx_meetings_date already keeps
+_SQL_SELECT_ALL = f"SELECT {_MEETING_COLUMNS} FROM meetings ORDER BY date DESC, id"
+# Keyset pages of _SQL_SELECT_ALL, resuming after the last row of the previous page
+_SQL_SELECT_FIRST_PAGE = f"{_SQL_SELECT_ALL} LIMIT :limit"
+_SQL_SELECT_NEXT_PAGE = f"""
+    SELECT {_MEETING_COLUMNS} FROM meetings
+    WHERE date < :date OR (date = :date AND id > :id)
+    ORDER BY date DESC, id LIMIT :limit
+"""
+_SQL_LIST_SUMMARIES = "SELECT id, title FROM meetings ORDER BY date DESC"
+# Takes the IDs as one JSON array so the text doesn't vary with their count
+_SQL_SELECT_AUDIO_PATHS = """
+    SELECT id, audio_path FROM meetings
+    WHERE id IN (SELECT value FROM json_each(?))
+"""
+_SQL_DELETE = "DELETE FROM meetings WHERE id = ?"
+_SQL_SELECT_EXISTING_IDS = "SELECT id FROM meetings WHERE id IN (SELECT value FROM json_each(?))"
+_SQL_INSERT_TERM = "INSERT OR IGNORE INTO meeting_terms (term, meeting_id) VALUES (?, ?)"
+_SQL_DELETE_TERMS = "DELETE FROM meeting_terms WHERE meeting_id = ?"
+_SQL_SEARCH_TERMS = """
+    SELECT meeting_id FROM meeting_terms
+    WHERE term IN (SELECT value FROM json_each(:terms))
+    GROUP BY meeting_id HAVING COUNT(*) = :count
+    ORDER BY meeting_id DESC
+"""
+_SQL_DATE_RANGE = (
+    "(:since IS NULL OR date >= :since) AND (:until IS NULL OR date < :until)")
+# Rank inside the CTE so that extra filters on meetings can't lead the
+# planner into scanning it instead of using the index
+_SQL_SEARCH = f"""
+    WITH fts_matches AS (
+        SELECT rowid, bm25(meetings_fts) AS score
+        FROM meetings_fts WHERE meetings_fts MATCH :match
+        ORDER BY score LIMIT :candidates
+    )
+    SELECT {_MEETING_COLUMNS} FROM fts_matches fm
+    JOIN meetings m ON m.id = fm.rowid
+    WHERE {_SQL_DATE_RANGE}
+    ORDER BY fm.score LIMIT :limit
+"""
+
+# Runs of letters and digits in any script, so "café" and "Zürich" stay whole
+_TERM_PATTERN = re.compile(r"[^\W_]+")
+
+
+def _extract_terms(text: str) -> set[str]:
+    """Split text into the distinct lowercase words kept in the term index."""
+    return {
+        term for term in _TERM_PATTERN.findall(text.lower())
+        if term not in STOP_WORDS and not term.isdigit()
+    }
 
 
 class Meeting(BaseModel):
@@ -21,6 +115,7 @@ class Meeting(BaseModel):
     key_points: list[str] = Field(default_factory=list)
     action_items: list[str] = Field(default_factory=list)
     audio_path: str = ""
+    audio_hash: Optional[str] = None
 
     # Allow arbitrary types (needed for sqlite3.Row compatibility)
     model_config = {"from_attributes": True}
@@ -30,16 +125,169 @@ class Meeting(BaseModel):
         return self.model_dump()
 
 
+class _MeetingRow(NamedTuple):
+    """A meeting as stored, read without Pydantic validation."""
+
+    id: int
+    title: str
+    date: str
+    transcript: str
+    summary: str
+    key_points: list[str]
+    action_items: list[str]
+    audio_path: str
+    audio_hash: Optional[str]
+
+    @classmethod
+    def from_db(cls, row: tuple) -> "_MeetingRow":
+        """Build from a row of _MEETING_COLUMNS, decoding the list fields."""
+        (meeting_id, title, date, transcript, summary, key_points, action_items,
+         audio_path, audio_hash) = row
+        # pydantic-core's Rust parser decodes these lists several
+        # times faster than json.loads on this hot read path.
+        return cls(meeting_id, title, date, transcript, summary,
+                   from_json(key_points), from_json(action_items),
+                   audio_path, audio_hash)
+
+    def to_meeting(self) -> Meeting:
+        """Convert to a validated Meeting."""
+        return Meeting(
+            id=self.id,
+            title=self.title,
+            date=self.date,
+            transcript=self.transcript,
+            summary=self.summary,
+            key_points=self.key_points,
+            action_items=self.action_items,
+            audio_path=self.audio_path,
+            audio_hash=self.audio_hash,
+        )
+
+
+class _ConnectionPool:
+    """One write connection plus a bounded set of read-only connections.
+
+    In WAL mode readers don't block the writer or each other, so each read
+    gets a connection (and page cache) of its own instead of queueing for the
+    writer. With no readers, reads share the writer under its lock.
+    """
+
+    def __init__(self, connect: Callable[[bool], sqlite3.Connection], readers: int):
+        self._connect = connect
+        self.writer = connect(False)
+        self.write_lock = threading.RLock()
+        self._has_readers = readers > 0
+        self._closed = False
+        # None marks a slot whose connection hasn't been opened yet
+        self._readers: queue.LifoQueue[Optional[sqlite3.Connection]] = queue.LifoQueue()
+        for _ in range(readers):
+            self._readers.put(None)
+
+    @contextmanager
+    def reader(self) -> Iterator[sqlite3.Connection]:
+        """Borrow a read-only connection, waiting if all are in use.
+
+        Raises:
+            sqlite3.ProgrammingError: If the pool has been closed.
+        """
+        self._check_open()
+        if not self._has_readers:
+            with self.write_lock:
+                yield self.writer
+            return
+        conn = self._readers.get()
+        try:
+            self._check_open()
+            if conn is None:
+                conn = self._connect(True)
+            yield conn
+        finally:
+            if self._closed and conn is not None:
+                # Borrowed while close() ran, so it's closed on return instead
+                conn.close()
+                conn = None
+            self._readers.put(conn)
+
+    def _check_open(self) -> None:
+        if self._closed:
+            raise sqlite3.ProgrammingError("Cannot operate on a closed database.")
+
+    def close(self) -> None:
+        """Close the writer and every idle reader.
+
+        Readers that are borrowed are closed when they are returned.
+        """
+        self._closed = True
+        with self.write_lock:
+            self.writer.close()
+        idle = []
+        while not self._readers.empty():
+            idle.append(self._readers.get_nowait())
+        for conn in idle:
+            if conn is not None:
+                conn.close()
+            self._readers.put(None)  # lets waiting readers see the pool is closed
+
+
 class MeetingDatabase:
     """SQLite database for meeting storage."""
 
-    def __init__(self, db_path: str = "meetings.db"):
+    def __init__(
+        self,
+        db_path: Union[str, "os.PathLike[str]"] = "meetings.db",
+        read_connections: int = 4,
+    ):
+        db_path = os.fspath(db_path)
         self.db_path = Path(db_path)
+        # "file:" paths are SQLite URIs, e.g. "file:name?mode=memory&cache=shared"
+        # for an in-memory database that several connections can open.
+        self._uri = db_path.startswith("file:")
+        self._source = db_path if self._uri else self.db_path
+        self._in_memory = self._is_in_memory(db_path)
+        # Connections live as long as the instance. Streamlit shares the cached
+        # database across script threads, so writes go through a lock instead
+        # of being tied to the thread that opened the connection. In-memory
+        # databases can't give readers a consistent view, so they get none.
+        self._pool = _ConnectionPool(
+            self._connect, 0 if self._in_memory else read_connections)
+        self._conn = self._pool.writer
+        self._lock = self._pool.write_lock
         self._init_db()
 
+    @staticmethod
+    def _is_in_memory(db_path: str) -> bool:
+        """Whether db_path names an in-memory database, as a path or a URI."""
+        if not db_path.startswith("file:"):
+            return db_path == ":memory:"
+        uri = urlsplit(db_path)
+        return (uri.path == ":memory:"
+                or "memory" in parse_qs(uri.query).get("mode", []))
+
+    def _connect(self, read_only: bool) -> sqlite3.Connection:
+        """Open a connection with the tuned PRAGMAs applied."""
+        conn = sqlite3.connect(
+            self._source,
+            uri=self._uri,
+            check_same_thread=False,
+            cached_statements=256,
+        )
+        conn.row_factory = sqlite3.Row
+        if read_only:
+            conn.execute("PRAGMA query_only=ON")
+        elif not self._in_memory:
+            # In-memory databases have no journal file to switch over
+            conn.execute("PRAGMA journal_mode=WAL")
+        conn.executescript(_PRAGMAS)
+        return conn
+
+    def close(self) -> None:
+        """Close the database connections."""
+        self._pool.close()
+
     def _init_db(self) -> None:
         """Initialize database tables."""
-        with sqlite3.connect(self.db_path) as conn:
+        self._check_sqlite(self._conn)
+        with self._lock, self._conn as conn:
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS meetings (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -49,110 +297,369 @@ class MeetingDatabase:
                     summary TEXT DEFAULT '',
                     key_points TEXT DEFAULT '[]',
                     action_items TEXT DEFAULT '[]',
-                    audio_path TEXT DEFAULT ''
+                    audio_path TEXT DEFAULT '',
+                    audio_hash TEXT
                 )
             """)
-            conn.commit()
+            columns = {row["name"]
+                       for row in conn.execute("PRAGMA table_info(meetings)")}
+            if "audio_hash" not in columns:
+                conn.execute("ALTER TABLE meetings ADD COLUMN audio_hash TEXT")
+            # Lookup for re-uploaded audio; NULL for meetings saved without one
+            conn.execute(
+                """
+                CREATE UNIQUE INDEX IF NOT EXISTS idx_meetings_audio_hash
+                ON meetings(audio_hash) WHERE audio_hash IS NOT NULL
+                """)
+            # Lets the newest-first listing read rows in index order
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_meetings_date ON meetings(date DESC)")
+            self._init_fts(conn)
+            self._init_terms(conn)
+
+    @staticmethod
+    def _check_sqlite(conn: sqlite3.Connection) -> None:
+        """Fail early if the SQLite library lacks the features the schema uses."""
+        if sqlite3.sqlite_version_info < MIN_SQLITE_VERSION:
+            raise RuntimeError(
+                f"SQLite {'.'.join(map(str, MIN_SQLITE_VERSION))} or newer is required"
+                f" for meeting search; Python is using SQLite {sqlite3.sqlite_version}")
+        try:
+            conn.execute("SELECT json_array()")
+        except sqlite3.OperationalError:
+            raise RuntimeError(
+                "SQLite was built without JSON support, which meeting storage needs"
+            ) from None
+
+    @staticmethod
+    def _init_fts(conn: sqlite3.Connection) -> None:
+        """Create the FTS5 index over meetings and the triggers that sync it."""
+        existing = conn.execute(
+            "SELECT sql FROM sqlite_master WHERE type='table' AND name='meetings_fts'"
+        ).fetchone()
+        rebuild = existing is None or "trigram" not in existing[0]
+        if existing is not None and rebuild:
+            # Earlier versions indexed whole words, which can't match substrings
+            conn.execute("DROP TABLE meetings_fts")
+        conn.execute("""
+            CREATE VIRTUAL TABLE IF NOT EXISTS meetings_fts USING fts5(
+                title, transcript, summary,
+                content='meetings', content_rowid='id',
+                tokenize='trigram'
+            )
+        """)
+        conn.executescript("""
+            CREATE TRIGGER IF NOT EXISTS meetings_fts_insert AFTER INSERT ON meetings BEGIN
+                INSERT INTO meetings_fts(rowid, title, transcript, summary)
+                VALUES (new.id, new.title, new.transcript, new.summary);
+            END;
+            CREATE TRIGGER IF NOT EXISTS meetings_fts_delete AFTER DELETE ON meetings BEGIN
+                INSERT INTO meetings_fts(meetings_fts, rowid, title, transcript, summary)
+                VALUES ('delete', old.id, old.title, old.transcript, old.summary);
+            END;
+            CREATE TRIGGER IF NOT EXISTS meetings_fts_update AFTER UPDATE ON meetings BEGIN
+                INSERT INTO meetings_fts(meetings_fts, rowid, title, transcript, summary)
+                VALUES ('delete', old.id, old.title, old.transcript, old.summary);
+                INSERT INTO meetings_fts(rowid, title, transcript, summary)
+                VALUES (new.id, new.title, new.transcript, new.summary);
+            END;
+        """)
+        if rebuild:
+            # Index meetings saved before this version of the index existed
+            conn.execute(
+                "INSERT INTO meetings_fts(meetings_fts) VALUES ('rebuild')")
+
+    @staticmethod
+    def _init_terms(conn: sqlite3.Connection) -> None:
+        """Create the word-to-meeting index used by search_meetings_terms().
+
+        Terms are written by save_meeting() and save_meetings(), in the same
+        transaction as the meeting; a trigger removes them with the meeting.
+        The schema stays plain SQL, so other SQLite clients can still write.
+        """
+        exists = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type='table' AND name='meeting_terms'"
+        ).fetchone()
+        conn.executescript("""
+            CREATE TABLE IF NOT EXISTS meeting_terms (
+                term TEXT NOT NULL,
+                meeting_id INTEGER NOT NULL,
+                PRIMARY KEY (term, meeting_id)
+            ) WITHOUT ROWID;
+            CREATE INDEX IF NOT EXISTS idx_meeting_terms_meeting
+                ON meeting_terms(meeting_id);
+            CREATE TRIGGER IF NOT EXISTS meeting_terms_delete AFTER DELETE ON meetings BEGIN
+                DELETE FROM meeting_terms WHERE meeting_id = old.id;
+            END;
+            -- Earlier versions indexed through triggers that called a Python
+            -- function, which broke writes from any other client
+            DROP TRIGGER IF EXISTS meeting_terms_insert;
+            DROP TRIGGER IF EXISTS meeting_terms_update;
+        """)
+        if not exists:
+            # Index meetings saved before the term index was added
+            rows = conn.execute("SELECT id, title, transcript FROM meetings")
+            conn.executemany(_SQL_INSERT_TERM, [
+                (term, meeting_id)
+                for meeting_id, title, transcript in rows
+                for term in _extract_terms(f"{title} {transcript}")
+            ])
 
     def save_meeting(self, meeting: Meeting) -> int:
         """Save a meeting to the database. Returns the meeting ID."""
-        with sqlite3.connect(self.db_path) as conn:
-            if meeting.id is None:
-                cursor = conn.execute(
-                    """
-                    INSERT INTO meetings (title, date, transcript, summary, key_points, action_items, audio_path)
-                    VALUES (?, ?, ?, ?, ?, ?, ?)
-                    """,
-                    (
-                        meeting.title,
-                        meeting.date,
-                        meeting.transcript,
-                        meeting.summary,
-                        json.dumps(meeting.key_points),
-                        json.dumps(meeting.action_items),
-                        meeting.audio_path,
-                    ),
-                )
-                meeting.id = cursor.lastrowid or 0
-            else:
-                conn.execute(
-                    """
-                    UPDATE meetings
-                    SET title=?, date=?, transcript=?, summary=?, key_points=?, action_items=?, audio_path=?
-                    WHERE id=?
-                    """,
-                    (
-                        meeting.title,
-                        meeting.date,
-                        meeting.transcript,
-                        meeting.summary,
-                        json.dumps(meeting.key_points),
-                        json.dumps(meeting.action_items),
-                        meeting.audio_path,
-                        meeting.id,
-                    ),
-                )
-            conn.commit()
+        with self._lock, self._conn as conn:
+            self._write_meeting(conn, meeting)
         return meeting.id  # type: ignore[return-value]
 
+    def save_meetings(self, meetings: Iterable[Meeting]) -> list[int]:
+        """Save several meetings in a single transaction.
+
+        Args:
+            meetings: Meetings to insert, or to update if they have an ID.
+
+        Returns:
+            The meeting IDs, in the order the meetings were given.
+        """
+        meetings = list(meetings)
+        new = [m for m in meetings if m.id is None]
+        with self._lock, self._conn as conn:
+            # Take the write lock up front and commit once for the batch
+            conn.execute("BEGIN IMMEDIATE")
+            updated = [m for m in meetings if m.id is not None]
+            if updated:
+                conn.executemany(
+                    _SQL_UPDATE, [(*self._row_values(m), m.id) for m in updated])
+                # Updates of IDs that don't exist change no rows; index none
+                found = {row[0] for row in conn.execute(
+                    _SQL_SELECT_EXISTING_IDS, (to_json([m.id for m in updated]).decode(),))}
+                self._index_terms(
+                    conn, [m for m in updated if m.id in found], replace=True)
+            if new:
+                conn.executemany(_SQL_INSERT, map(self._row_values, new))
+                # Holding the write lock, the batch got consecutive IDs
+                last_id = conn.execute("SELECT last_insert_rowid()").fetchone()[0]
+                first_id = last_id - len(new) + 1
+                for offset, meeting in enumerate(new):
+                    meeting.id = first_id + offset
+                self._index_terms(conn, new)
+            if len(meetings) > ANALYZE_THRESHOLD:
+                conn.execute("ANALYZE")
+        return [m.id for m in meetings]  # type: ignore[misc]
+
+    @classmethod
+    def _write_meeting(cls, conn: sqlite3.Connection, meeting: Meeting) -> None:
+        """Insert or update a meeting on conn, setting its ID if new."""
+        if meeting.id is None:
+            cursor = conn.execute(_SQL_INSERT, cls._row_values(meeting))
+            if cursor.lastrowid is None:
+                raise sqlite3.DatabaseError("INSERT into meetings returned no row ID")
+            meeting.id = cursor.lastrowid
+            cls._index_terms(conn, [meeting])
+        else:
+            cursor = conn.execute(_SQL_UPDATE, (*cls._row_values(meeting), meeting.id))
+            if cursor.rowcount:  # no row has this ID, so there is nothing to index
+                cls._index_terms(conn, [meeting], replace=True)
+
+    @staticmethod
+    def _index_terms(
+        conn: sqlite3.Connection, meetings: list[Meeting], replace: bool = False
+    ) -> None:
+        """Add the meetings' title and transcript words to the term index."""
+        if replace:
+            conn.executemany(_SQL_DELETE_TERMS, [(m.id,) for m in meetings])
+        conn.executemany(_SQL_INSERT_TERM, [
+            (term, m.id)
+            for m in meetings
+            for term in _extract_terms(f"{m.title} {m.transcript}")
+        ])
+
+    @staticmethod
+    def _row_values(meeting: Meeting) -> tuple:
+        """Parameters for _SQL_INSERT, and for _SQL_UPDATE before the ID.
+
+        The list fields are encoded with pydantic-core's Rust serializer,
+        the counterpart of the from_json() used when reading them back.
+        """
+        return (
+            meeting.title,
+            meeting.date,
+            meeting.transcript,
+            meeting.summary,
+            to_json(meeting.key_points).decode(),
+            to_json(meeting.action_items).decode(),
+            meeting.audio_path,
+            meeting.audio_hash,
+        )
+
     def get_meeting(self, meeting_id: int) -> Optional[Meeting]:
         """Retrieve a single meeting by ID."""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
-            row = conn.execute(
-                "SELECT * FROM meetings WHERE id = ?", (meeting_id,)
-            ).fetchone()
-            if row is None:
-                return None
-            return self._row_to_meeting(row)
+        meetings = self._fetch_meetings(_SQL_SELECT_ONE, (meeting_id,))
+        return meetings[0] if meetings else None
+
+    def get_meeting_by_hash(self, audio_hash: str) -> Optional[Meeting]:
+        """Retrieve the meeting transcribed from audio with the given hash."""
+        meetings = self._fetch_meetings(_SQL_SELECT_BY_HASH, (audio_hash,))
+        return meetings[0] if meetings else None
 
     def get_all_meetings(self) -> list[Meeting]:
         """Retrieve all meetings, newest first."""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
-            rows = conn.execute(
-                "SELECT * FROM meetings ORDER BY date DESC"
-            ).fetchall()
-            return [self._row_to_meeting(row) for row in rows]
+        return self._fetch_meetings(_SQL_SELECT_ALL)
+
+    def iter_meetings(self) -> Iterator[_MeetingRow]:
+        """
+        Iterate over all meetings, newest first, without building models.
+
+        Meant for bulk reads such as exports, where validating every record
+        as a Meeting is wasted work. Rows are fetched in pages of
+        FETCH_BATCH_SIZE rather than loaded all at once. Each page is its own
+        query, so no connection or lock is held while the caller consumes the
+        rows, and meetings saved in the meantime may or may not appear.
+
+        Yields:
+            Named tuples with the same fields as Meeting.
+        """
+        sql, params = _SQL_SELECT_FIRST_PAGE, {"limit": FETCH_BATCH_SIZE}
+        while True:
+            with self._pool.reader() as conn:
+                cursor = conn.cursor()
+                cursor.row_factory = None  # plain tuples, no sqlite3.Row wrapping
+                rows = cursor.execute(sql, params).fetchall()
+            yield from map(_MeetingRow.from_db, rows)
+            if len(rows) < params["limit"]:
+                return
+            last_id, _, last_date = rows[-1][:3]
+            sql = _SQL_SELECT_NEXT_PAGE
+            params = {"date": last_date, "id": last_id, "limit": FETCH_BATCH_SIZE}
+
+    def list_meeting_summaries(self) -> list[tuple[int, str]]:
+        """List (id, title) pairs, newest first, without loading full records."""
+        with self._pool.reader() as conn:
+            cursor = conn.cursor()
+            cursor.row_factory = None  # plain tuples, no sqlite3.Row wrapping
+            return cursor.execute(_SQL_LIST_SUMMARIES).fetchall()
 
     def delete_meeting(self, meeting_id: int) -> Optional[str]:
         """Delete a meeting by ID. Returns the audio_path if deleted, None otherwise."""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
-            row = conn.execute(
-                "SELECT audio_path FROM meetings WHERE id = ?", (meeting_id,)
-            ).fetchone()
-            if row is None:
-                return None
-            audio_path = row["audio_path"]
-            conn.execute("DELETE FROM meetings WHERE id = ?", (meeting_id,))
-            conn.commit()
-            return audio_path
-
-    def search_meetings(self, query: str) -> list[Meeting]:
-        """Search meetings by title, transcript, or summary."""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
+        return self.delete_meetings([meeting_id]).get(meeting_id)
+
+    def delete_meetings(self, meeting_ids: list[int]) -> dict[int, str]:
+        """
+        Delete several meetings in a single transaction.
+
+        Args:
+            meeting_ids: IDs of the meetings to delete.
+
+        Returns:
+            Mapping of each deleted meeting's ID to its audio_path.
+            IDs that did not exist are left out.
+        """
+        if not meeting_ids:
+            return {}
+        with self._lock, self._conn as conn:
             rows = conn.execute(
-                """
-                SELECT * FROM meetings
-                WHERE title LIKE ? OR transcript LIKE ? OR summary LIKE ?
-                ORDER BY date DESC
-                """,
-                (f"%{query}%", f"%{query}%", f"%{query}%"),
+                _SQL_SELECT_AUDIO_PATHS, (to_json(list(meeting_ids)).decode(),)
             ).fetchall()
-            return [self._row_to_meeting(row) for row in rows]
+            conn.executemany(_SQL_DELETE, [(row["id"],) for row in rows])
+            return {row["id"]: row["audio_path"] for row in rows}
 
-    @staticmethod
-    def _row_to_meeting(row: sqlite3.Row) -> Meeting:
-        """Convert a database row to a Meeting object."""
-        return Meeting(
-            id=row["id"],
-            title=row["title"],
-            date=row["date"],
-            transcript=row["transcript"],
-            summary=row["summary"],
-            key_points=json.loads(row["key_points"]),
-            action_items=json.loads(row["action_items"]),
-            audio_path=row["audio_path"],
+    def search_meetings(
+        self,
+        query: str,
+        since: Optional[str] = None,
+        until: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> list[Meeting]:
+        """Search meetings by title, transcript, or summary.
+
+        Every term must appear, case-insensitively, as a substring of one of
+        the fields. Results are ranked by relevance.
+
+        Args:
+            query: Search terms; a blank query lists all meetings.
+            since: Only include meetings on or after this date.
+            until: Only include meetings before this date.
+            limit: Maximum number of results. With a date filter, only the
+                ``limit * 10`` best text matches are considered.
+
+        Returns:
+            The matching meetings.
+        """
+        terms = query.replace('"', " ").split()
+        params: dict = {
+            "since": since,
+            "until": until,
+            "limit": -1 if limit is None else limit,
+        }
+
+        if terms and min(len(term) for term in terms) >= 3:
+            params["match"] = self._fts_query(terms)
+            params["candidates"] = params["limit"]
+            if limit is not None and (since is not None or until is not None):
+                params["candidates"] = limit * 10
+            return self._fetch_meetings(_SQL_SEARCH, params)
+
+        # The trigram index can't look up terms shorter than 3 chars
+        where, like_params = self._like_filter(terms)
+        return self._fetch_meetings(
+            f"""
+            SELECT {_MEETING_COLUMNS} FROM meetings
+            WHERE {" AND ".join([*where, _SQL_DATE_RANGE])}
+            ORDER BY date DESC LIMIT :limit
+            """,
+            {**params, **like_params},
         )
+
+    def search_meetings_terms(self, query: str) -> list[int]:
+        """
+        Find meetings whose title or transcript contains every word of query.
+
+        Unlike search_meetings(), this matches whole words only, ignores stop
+        words and numbers, and returns IDs without loading any meetings.
+
+        Args:
+            query: Words to look up.
+
+        Returns:
+            IDs of the matching meetings, most recently added first.
+        """
+        terms = _extract_terms(query)
+        if not terms:
+            return []
+        params = {"terms": to_json(sorted(terms)).decode(), "count": len(terms)}
+        with self._pool.reader() as conn:
+            return [row[0] for row in conn.execute(_SQL_SEARCH_TERMS, params)]
+
+    @staticmethod
+    def _fts_query(terms: list[str]) -> str:
+        """Turn search terms into an FTS5 query of quoted strings (ANDed)."""
+        return " ".join('"' + term + '"' for term in terms)
+
+    @staticmethod
+    def _like_filter(terms: list[str]) -> tuple[list[str], dict[str, str]]:
+        """Build WHERE conditions matching every term as a substring."""
+        where = []
+        params = {}
+        for i, term in enumerate(terms):
+            where.append(
+                f"(title LIKE :t{i} ESCAPE '!' OR transcript LIKE :t{i} ESCAPE '!'"
+                f" OR summary LIKE :t{i} ESCAPE '!')")
+            escaped = term.replace("!", "!!").replace("%", "!%").replace("_", "!_")
+            params[f"t{i}"] = f"%{escaped}%"
+        return where, params
+
+    def _fetch_meetings(
+        self, sql: str, params: Union[Sequence, dict] = ()
+    ) -> list[Meeting]:
+        """Run a SELECT of _MEETING_COLUMNS and convert the rows to meetings.
+
+        Rows are converted in batches as they are fetched; the read
+        connection is returned once the last one is.
+        """
+        meetings = []
+        with self._pool.reader() as conn:
+            cursor = conn.cursor()
+            cursor.row_factory = None  # plain tuples, no sqlite3.Row wrapping
+            cursor.execute(sql, params)
+            while rows := cursor.fetchmany(FETCH_BATCH_SIZE):
+                meetings.extend(_MeetingRow.from_db(row).to_meeting() for row in rows)
+        return meetings
@@ -0,0 +1,33 @@
+"""Words left out of the meeting term index."""
+
+# NLTK's English stop word list
+_NLTK_STOP_WORDS = {
+    "i", "me", "my", "myself", "we", "our", "ours", "ourselves", "you",
+    "you're", "you've", "you'll", "you'd", "your", "yours", "yourself",
+    "yourselves", "he", "him", "his", "himself", "she", "she's", "her", "hers",
+    "herself", "it", "it's", "its", "itself", "they", "them", "their", "theirs",
+    "themselves", "what", "which", "who", "whom", "this", "that", "that'll",
+    "these", "those", "am", "is", "are", "was", "were", "be", "been", "being",
+    "have", "has", "had", "having", "do", "does", "did", "doing", "a", "an",
+    "the", "and", "but", "if", "or", "because", "as", "until", "while", "of",
+    "at", "by", "for", "with", "about", "against", "between", "into", "through",
+    "during", "before", "after", "above", "below", "to", "from", "up", "down",
+    "in", "out", "on", "off", "over", "under", "again", "further", "then",
+    "once", "here", "there", "when", "where", "why", "how", "all", "any",
+    "both", "each", "few", "more", "most", "other", "some", "such", "no", "nor",
+    "not", "only", "own", "same", "so", "than", "too", "very", "s", "t", "can",
+    "will", "just", "don", "don't", "should", "should've", "now", "d", "ll",
+    "m", "o", "re", "ve", "y", "ain", "aren", "aren't", "couldn", "couldn't",
+    "didn", "didn't", "doesn", "doesn't", "hadn", "hadn't", "hasn", "hasn't",
+    "haven", "haven't", "isn", "isn't", "ma", "mightn", "mightn't", "mustn",
+    "mustn't", "needn", "needn't", "shan", "shan't", "shouldn", "shouldn't",
+    "wasn", "wasn't", "weren", "weren't", "won", "won't", "wouldn", "wouldn't",
+}
+
+# Filler that speech transcripts are full of but that never identifies a meeting
+_TRANSCRIPT_STOP_WORDS = {
+    "um", "umm", "uh", "uhm", "hmm", "mm", "ah", "oh", "yeah", "yep", "ok",
+    "okay", "right", "like", "gonna", "wanna", "gotta", "kinda", "sorta",
+}
+
+STOP_WORDS = frozenset(_NLTK_STOP_WORDS | _TRANSCRIPT_STOP_WORDS)
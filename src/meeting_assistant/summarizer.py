@@ -2,13 +2,59 @@
 
 import json
 import os
-from typing import Optional
+import re
+from concurrent.futures import ThreadPoolExecutor
+from functools import cache
+from hashlib import blake2b
+from typing import Iterator, Optional, Union
 
+import diskcache
+import tiktoken
 from dotenv import load_dotenv
 from openai import OpenAI
 
 load_dotenv()
 
+# Upper bound on concurrent requests sent to the LLM server for one task.
+MAX_PARALLEL_REQUESTS = 8
+
+# Transcript budget per request, sized for 4k-context local models, and the
+# overlap carried between consecutive summary chunks for continuity.
+MAX_TRANSCRIPT_TOKENS = 3000
+CHUNK_OVERLAP_TOKENS = 300
+
+
+class _ApproximateEncoding:
+    """Stand-in for tiktoken when its encoding file can't be loaded.
+
+    Each "token" is a run of up to four characters of a word, with the
+    whitespace before it. That overestimates tiktoken's count for English,
+    so budgets stay within the context window. Decoding joins the pieces
+    back into the original text.
+    """
+
+    _PIECE = re.compile(r"\s*\S{1,4}|\s+")
+
+    def encode(self, text: str) -> list[str]:
+        return self._PIECE.findall(text)
+
+    def decode(self, tokens: list[str]) -> str:
+        return "".join(tokens)
+
+
+@cache
+def _encoding() -> Union[tiktoken.Encoding, "_ApproximateEncoding"]:
+    """Token encoding used to measure transcript length (loaded on first use).
+
+    tiktoken downloads cl100k_base the first time it is used. Offline,
+    fall back to an approximation, so a finished transcription isn't
+    lost to a network error.
+    """
+    try:
+        return tiktoken.get_encoding("cl100k_base")
+    except Exception:
+        return _ApproximateEncoding()
+
 
 class Summarizer:
     """Generates meeting summaries, key points, and action items using an LLM."""
@@ -18,6 +64,7 @@ class Summarizer:
         base_url: Optional[str] = None,
         model: Optional[str] = None,
         api_key: str = "not-needed",
+        cache_dir: Optional[str] = None,
     ):
         """
         Initialize the summarizer.
@@ -26,13 +73,40 @@ class Summarizer:
             base_url: LLM API endpoint (defaults to LLM_BASE_URL env var).
             model: Model name to use (defaults to LLM_MODEL env var).
             api_key: API key (not needed for local models).
+            cache_dir: Directory of the persistent response cache
+                (defaults to LLM_CACHE_DIR env var, or '.llm_cache').
         """
         self.base_url = base_url or os.environ["LLM_BASE_URL"]
         self.model = model or os.environ["LLM_MODEL"]
         self.client = OpenAI(base_url=self.base_url, api_key=api_key)
+        self._cache = diskcache.Cache(
+            cache_dir or os.environ.get("LLM_CACHE_DIR", ".llm_cache"))
+
+    def _cache_key(
+        self,
+        system_prompt: str,
+        user_message: str,
+        response_format: Optional[dict] = None,
+    ) -> str:
+        """Hash the model, prompts and output format into a response cache key."""
+        key = f"{self.model}|{system_prompt}|{user_message}"
+        if response_format is not None:
+            key += f"|{json.dumps(response_format, sort_keys=True)}"
+        return blake2b(key.encode()).hexdigest()
+
+    def _chat(
+        self,
+        system_prompt: str,
+        user_message: str,
+        response_format: Optional[dict] = None,
+    ) -> str:
+        """Send a chat completion request to the LLM, reusing cached replies."""
+        key = self._cache_key(system_prompt, user_message, response_format)
+        cached = self._cache.get(key)
+        if cached is not None:
+            return cached
 
-    def _chat(self, system_prompt: str, user_message: str) -> str:
-        """Send a chat completion request to the LLM."""
+        extra = {"response_format": response_format} if response_format else {}
         response = self.client.chat.completions.create(
             model=self.model,
             messages=[
@@ -40,40 +114,85 @@ class Summarizer:
                 {"role": "user", "content": user_message},
             ],
             temperature=0.3,
+            **extra,
+        )
+        content = (response.choices[0].message.content or "").strip()
+        self._cache.set(key, content)
+        return content
+
+    def _chat_stream(self, system_prompt: str, user_message: str) -> Iterator[str]:
+        """Stream a chat completion token by token, caching the full reply."""
+        key = self._cache_key(system_prompt, user_message)
+        cached = self._cache.get(key)
+        if cached is not None:
+            yield cached
+            return
+
+        stream = self.client.chat.completions.create(
+            model=self.model,
+            messages=[
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": user_message},
+            ],
+            temperature=0.3,
+            stream=True,
         )
-        return (response.choices[0].message.content or "").strip()
+        parts = []
+        for chunk in stream:
+            delta = chunk.choices[0].delta.content if chunk.choices else None
+            if delta:
+                parts.append(delta)
+                yield delta
+        self._cache.set(key, "".join(parts).strip())
 
-    def _chunk_transcript(self, text: str, max_words: int = 800) -> list[str]:
-        """Split long transcripts into manageable chunks."""
-        words = text.split()
+    def _chunk_transcript(
+        self,
+        text: str,
+        max_tokens: int = MAX_TRANSCRIPT_TOKENS,
+        overlap: int = CHUNK_OVERLAP_TOKENS,
+    ) -> list[str]:
+        """Split long transcripts into overlapping chunks of at most max_tokens."""
+        enc = _encoding()
+        tokens = enc.encode(text)
+        if len(tokens) <= max_tokens:
+            return [text] if tokens else []
+        step = max_tokens - overlap
         return [
-            " ".join(words[i:i + max_words])
-            for i in range(0, len(words), max_words)
+            enc.decode(tokens[i:i + max_tokens])
+            for i in range(0, len(tokens) - overlap, step)
         ]
 
-    def _parse_json_list(self, response: str) -> list[str]:
-        """Robustly parse a JSON array from LLM response."""
-        cleaned = response.strip()
-        cleaned = cleaned.replace("```json", "").replace("```", "").strip()
+    @staticmethod
+    def _truncate(text: str, max_tokens: int = MAX_TRANSCRIPT_TOKENS) -> str:
+        """Cut text down to the first max_tokens tokens."""
+        enc = _encoding()
+        tokens = enc.encode(text)
+        return text if len(tokens) <= max_tokens else enc.decode(tokens[:max_tokens])
 
-        start = cleaned.find("[")
-        end = cleaned.rfind("]") + 1
-        if start != -1 and end > start:
-            cleaned = cleaned[start:end]
+    def _extract_items(self, system_prompt: str, transcript: str) -> list[str]:
+        """Request a JSON object of the form {"items": [...]} and return the items.
 
+        JSON mode guarantees valid JSON but not the key, so an object holding
+        a single list under another name is accepted too. Anything in the
+        list that isn't a string (null, numbers, nested objects) is dropped.
+        """
+        response = self._chat(
+            system_prompt,
+            f"Meeting transcript:\n\n{transcript}",
+            response_format={"type": "json_object"},
+        )
         try:
-            return json.loads(cleaned)
+            data = json.loads(response)
         except json.JSONDecodeError:
-            return [
-                line.strip().lstrip("•-*0123456789. \"")
-                for line in response.split("\n")
-                if line.strip()
-                and line.strip() not in ["[", "]"]
-                and not line.strip().startswith(
-                    ("import", "def ", "for ", "action_",
-                     "meeting_", "#", "json", "print")
-                )
-            ]
+            return []
+        if isinstance(data, dict):
+            if "items" in data:
+                data = data["items"]
+            elif len(data) == 1:
+                data = next(iter(data.values()))
+        if not isinstance(data, list):
+            return []
+        return [item.strip() for item in data if isinstance(item, str) and item.strip()]
 
     def generate_summary(self, transcript: str) -> str:
         """
@@ -92,11 +211,17 @@ class Summarizer:
             "Write in a professional tone using past tense."
         )
         chunks = self._chunk_transcript(transcript)
-        if len(chunks) == 1:
+        if len(chunks) <= 1:
             return self._chat(system_prompt, f"Meeting transcript:\n\n{transcript}")
 
-        partial = [self._chat(
-            system_prompt, f"Meeting transcript:\n\n{c}") for c in chunks]
+        # Map: summarize chunks concurrently; reduce: one final pass below.
+        with ThreadPoolExecutor(
+                max_workers=min(len(chunks), MAX_PARALLEL_REQUESTS)) as executor:
+            partial = list(executor.map(
+                lambda c: self._chat(
+                    system_prompt, f"Meeting transcript:\n\n{c}"),
+                chunks,
+            ))
         combined = "\n\n".join(partial)
         return self._chat(system_prompt, f"Meeting transcript:\n\n{combined}")
 
@@ -110,15 +235,13 @@ class Summarizer:
         Returns:
             List of key points as strings.
         """
-        transcript = " ".join(transcript.split()[:800])  # truncate for safety
+        transcript = self._truncate(transcript)  # stay within the context window
         system_prompt = (
-            "OUTPUT FORMAT: JSON array only. Example: [\"Point 1\", \"Point 2\"]\n"
-            "RULES: No code. No explanation. No markdown. No imports. No variables.\n"
+            "OUTPUT FORMAT: JSON object only. Example: {\"items\": [\"Point 1\", \"Point 2\"]}\n"
+            "RULES: No code. No explanation. No markdown.\n"
             "TASK: Extract the most important key points from the meeting transcript below."
         )
-        response = self._chat(
-            system_prompt, f"Meeting transcript:\n\n{transcript}")
-        return self._parse_json_list(response)
+        return self._extract_items(system_prompt, transcript)
 
     def extract_action_items(self, transcript: str) -> list[str]:
         """
@@ -130,15 +253,13 @@ class Summarizer:
         Returns:
             List of action items as strings.
         """
-        transcript = " ".join(transcript.split()[:800])  # truncate for safety
+        transcript = self._truncate(transcript)  # stay within the context window
         system_prompt = (
-            "OUTPUT FORMAT: JSON array only. Example: [\"Action 1\", \"Action 2\"]\n"
-            "RULES: No code. No explanation. No markdown. No imports. No variables.\n"
+            "OUTPUT FORMAT: JSON object only. Example: {\"items\": [\"Action 1\", \"Action 2\"]}\n"
+            "RULES: No code. No explanation. No markdown.\n"
             "TASK: Extract all action items and follow-ups from the meeting transcript below."
         )
-        response = self._chat(
-            system_prompt, f"Meeting transcript:\n\n{transcript}")
-        return self._parse_json_list(response)
+        return self._extract_items(system_prompt, transcript)
 
     def generate_title(self, transcript: str) -> str:
         """
@@ -150,7 +271,7 @@ class Summarizer:
         Returns:
             A short, descriptive meeting title.
         """
-        transcript = " ".join(transcript.split()[:800])  # truncate for safety
+        transcript = self._truncate(transcript)  # stay within the context window
         system_prompt = (
             "OUTPUT FORMAT: Plain text title only, max 10 words.\n"
             "RULES: No code. No explanation. No markdown. No quotes.\n"
@@ -169,7 +290,25 @@ class Summarizer:
         Returns:
             An answer based on the transcript content.
         """
-        transcript = " ".join(transcript.split()[:800])  # truncate for safety
+        return self._chat(*self._question_prompts(transcript, question))
+
+    def stream_answer(self, transcript: str, question: str) -> Iterator[str]:
+        """
+        Answer a question about the meeting, yielding the answer as it is generated.
+
+        Args:
+            transcript: The full meeting transcript text.
+            question: The user's question about the meeting.
+
+        Returns:
+            An iterator over pieces of the answer text.
+        """
+        return self._chat_stream(*self._question_prompts(transcript, question))
+
+    @classmethod
+    def _question_prompts(cls, transcript: str, question: str) -> tuple[str, str]:
+        """Build the (system, user) prompts for a question about a transcript."""
+        transcript = cls._truncate(transcript)  # stay within the context window
         system_prompt = (
             "You are a professional meeting notes assistant. "
             "Answer the user's question based ONLY on the meeting transcript provided. "
@@ -179,7 +318,7 @@ class Summarizer:
             f"Meeting transcript:\n\n{transcript}\n\n"
             f"Question: {question}"
         )
-        return self._chat(system_prompt, user_message)
+        return system_prompt, user_message
 
     def process_meeting(self, transcript: str) -> dict:
         """
@@ -191,9 +330,17 @@ class Summarizer:
         Returns:
             Dictionary with title, summary, key_points, and action_items.
         """
-        return {
-            "title": self.generate_title(transcript),
-            "summary": self.generate_summary(transcript),
-            "key_points": self.extract_key_points(transcript),
-            "action_items": self.extract_action_items(transcript),
+        # The four calls are independent and spend their time waiting on the
+        # LLM server, so run them concurrently instead of back to back.
+        tasks = {
+            "title": self.generate_title,
+            "summary": self.generate_summary,
+            "key_points": self.extract_key_points,
+            "action_items": self.extract_action_items,
         }
+        with ThreadPoolExecutor(max_workers=len(tasks)) as executor:
+            futures = {
+                key: executor.submit(task, transcript)
+                for key, task in tasks.items()
+            }
+            return {key: future.result() for key, future in futures.items()}
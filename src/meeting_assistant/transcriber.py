@@ -1,38 +1,122 @@
-"""Audio transcription using OpenAI Whisper."""
+"""Audio transcription using faster-whisper (CTranslate2 Whisper)."""
 
 import os
-import tempfile
 from pathlib import Path
-from typing import Optional
+from typing import BinaryIO, Optional
 
+import ctranslate2
 import numpy as np
 import soundfile as sf
-import whisper
 from dotenv import load_dotenv
+from faster_whisper import BatchedInferencePipeline, WhisperModel, decode_audio
+from scipy.signal import resample_poly
 
 load_dotenv()
 
+# Whisper models operate on 16 kHz mono audio.
+SAMPLE_RATE = 16000
+
+# Silero VAD settings: pauses longer than this are cut before encoding.
+VAD_PARAMETERS = {"min_silence_duration_ms": 500}
+
+
+def _to_whisper_input(audio: np.ndarray, sample_rate: int) -> np.ndarray:
+    """Downmix to mono float32 and resample to SAMPLE_RATE."""
+    audio = np.asarray(audio, dtype=np.float32)
+    if audio.ndim > 1:
+        audio = audio.mean(axis=1)
+    if sample_rate != SAMPLE_RATE:
+        audio = resample_poly(audio, SAMPLE_RATE, sample_rate).astype(np.float32)
+    return audio
+
+
+def _decode(source: str | BinaryIO) -> np.ndarray:
+    """Decode a file path or binary stream to a 16 kHz mono waveform."""
+    try:
+        # libsndfile reads WAV/FLAC/OGG (and MP3) without spawning a demuxer
+        data, sample_rate = sf.read(source, dtype="float32")
+        return _to_whisper_input(data, sample_rate)
+    except sf.LibsndfileError:
+        # Containers libsndfile does not support (e.g. M4A) go through PyAV
+        if not isinstance(source, str):
+            source.seek(0)
+        return decode_audio(source, sampling_rate=SAMPLE_RATE)
+
 
 class Transcriber:
     """Handles audio transcription using Whisper model."""
 
-    def __init__(self, model_size: Optional[str] = None):
+    def __init__(
+        self,
+        model_size: Optional[str] = None,
+        batch_size: Optional[int] = None,
+        device: Optional[str] = None,
+        compute_type: Optional[str] = None,
+        device_index: Optional[int] = None,
+    ):
         """
         Initialize the transcriber.
 
         Args:
             model_size: Whisper model size ('tiny', 'base', 'small', 'medium', 'large')
+            batch_size: Number of 30-second chunks decoded in parallel
+                (defaults to WHISPER_BATCH_SIZE env var, or 16).
+            device: 'cuda' or 'cpu' (defaults to WHISPER_DEVICE env var,
+                or CUDA when a GPU is available).
+            compute_type: CTranslate2 compute type (defaults to
+                WHISPER_COMPUTE_TYPE env var, or 'float16' on CUDA and
+                'int8' on CPU).
+            device_index: GPU to pin the model to (defaults to
+                WHISPER_DEVICE_INDEX env var, or 0).
         """
         self.model_size = model_size or os.environ["WHISPER_MODEL_SIZE"]
-        self._model: Optional[whisper.Whisper] = None
+        self.batch_size = batch_size or int(
+            os.environ.get("WHISPER_BATCH_SIZE", "16"))
+        self.device = device or os.environ.get("WHISPER_DEVICE") or (
+            "cuda" if ctranslate2.get_cuda_device_count() > 0 else "cpu")
+        self.compute_type = compute_type or os.environ.get(
+            "WHISPER_COMPUTE_TYPE") or (
+            "float16" if self.device == "cuda" else "int8")
+        self.device_index = device_index if device_index is not None else int(
+            os.environ.get("WHISPER_DEVICE_INDEX", "0"))
+        self._model: Optional[WhisperModel] = None
+        self._pipeline: Optional[BatchedInferencePipeline] = None
 
     @property
-    def model(self) -> whisper.Whisper:
-        """Lazy-load the Whisper model."""
+    def model(self) -> WhisperModel:
+        """Lazy-load the Whisper model on the selected device."""
         if self._model is None:
-            self._model = whisper.load_model(self.model_size)
+            self._model = WhisperModel(
+                self.model_size,
+                device=self.device,
+                device_index=self.device_index,
+                compute_type=self.compute_type,
+            )
         return self._model
 
+    @property
+    def pipeline(self) -> BatchedInferencePipeline:
+        """Lazy-build the batched inference pipeline around the model."""
+        if self._pipeline is None:
+            self._pipeline = BatchedInferencePipeline(model=self.model)
+        return self._pipeline
+
+    @staticmethod
+    def load_audio(audio_path: str | Path | BinaryIO) -> np.ndarray:
+        """
+        Decode an audio file into a 16 kHz mono float32 waveform.
+
+        Args:
+            audio_path: Path to the audio file, or a binary stream of its
+                contents (decoded without touching the disk).
+
+        Returns:
+            The decoded waveform, ready to pass to transcribe_array().
+        """
+        if isinstance(audio_path, Path):
+            audio_path = str(audio_path)
+        return _decode(audio_path)
+
     def transcribe_file(self, audio_path: str | Path) -> dict:
         """
         Transcribe an audio file.
@@ -43,24 +127,35 @@ class Transcriber:
         Returns:
             Dictionary with 'text' (full transcript) and 'segments' (timestamped chunks).
         """
-        audio_path = str(audio_path)
-        result: dict = self.model.transcribe(
-            audio_path, fp16=False)  # type: ignore[assignment]
-        segments = result.get("segments", [])
+        return self._transcribe(self.load_audio(audio_path))
+
+    def _transcribe(self, audio: np.ndarray) -> dict:
+        """Run the batched pipeline on a 16 kHz mono waveform."""
+        # VAD splits the audio into speech chunks that are decoded in batches
+        # instead of Whisper's sequential 30-second sliding window.
+        raw_segments, info = self.pipeline.transcribe(
+            audio,
+            batch_size=self.batch_size,
+            vad_filter=True,
+            vad_parameters=VAD_PARAMETERS,
+            beam_size=1,
+        )
+        # Segments are a lazy generator; decoding happens while iterating.
+        segments = [
+            {
+                "start": seg.start,
+                "end": seg.end,
+                "text": seg.text.strip(),
+            }
+            for seg in raw_segments
+        ]
         return {
-            "text": str(result.get("text", "")).strip(),
-            "segments": [
-                {
-                    "start": seg.get("start"),
-                    "end": seg.get("end"),
-                    "text": str(seg.get("text", "")).strip(),
-                }
-                for seg in segments
-            ],
-            "language": result.get("language", "en"),
+            "text": " ".join(seg["text"] for seg in segments).strip(),
+            "segments": segments,
+            "language": info.language or "en",
         }
 
-    def transcribe_array(self, audio_array: np.ndarray, sample_rate: int = 16000) -> dict:
+    def transcribe_array(self, audio_array: np.ndarray, sample_rate: int = SAMPLE_RATE) -> dict:
         """
         Transcribe audio from a numpy array.
 
@@ -71,10 +166,7 @@ class Transcriber:
         Returns:
             Dictionary with 'text' and 'segments'.
         """
-        # Save to a temporary file (Whisper requires file input)
-        with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as tmp:
-            sf.write(tmp.name, audio_array, sample_rate)
-            return self.transcribe_file(tmp.name)
+        return self._transcribe(_to_whisper_input(audio_array, sample_rate))
 
     @staticmethod
     def save_audio(audio_array: np.ndarray, path: str | Path, sample_rate: int = 16000) -> Path:
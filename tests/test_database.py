@@ -1,17 +1,173 @@
 """Tests for the MeetingDatabase module."""
 
+import json
+import os
+import sqlite3
 import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Iterator
 
+import numpy as np
+import pydantic
 import pytest  # type: ignore[import-untyped]
 
-from meeting_assistant.database import Meeting, MeetingDatabase
+from meeting_assistant import database
+from meeting_assistant.database import _SQL_INSERT, Meeting, MeetingDatabase
+
+# Set PYTEST_FAST_DB to trade durability for speed in on-disk test databases
+FAST_DB = bool(os.environ.get("PYTEST_FAST_DB"))
+
+_VOCABULARY = ["budget", "roadmap", "hiring", "launch", "design", "review",
+               "customer", "release", "metrics", "sprint", "backlog", "pricing"]
+
+
+def _gen_rows(n: int, words_per_transcript: int = 30,
+             seed: int = 0) -> list[tuple[str, str, str]]:
+    """Generate n (title, date, transcript) rows of meeting fields.
+
+    Transcripts are random vocabulary words, assembled by viewing each row of
+    fixed-width byte strings as one string, so the cost stays in NumPy.
+    """
+    rng = np.random.default_rng(seed)
+    width = max(map(len, _VOCABULARY)) + 1
+    words = np.array([w.ljust(width).encode() for w in _VOCABULARY], dtype=f"S{width}")
+    picked = words[rng.integers(0, len(words), (n, words_per_transcript))]
+    transcripts = np.char.decode(
+        picked.view(f"S{width * words_per_transcript}").ravel())
+    titles = np.char.add("Meeting ", np.arange(n).astype(str))
+    minutes = rng.integers(0, 365 * 24 * 60, n).astype("timedelta64[m]")
+    dates = np.char.replace((np.datetime64("2024-01-01T00:00") + minutes).astype(str),
+                            "T", " ")
+    return list(zip(titles.tolist(), dates.tolist(), transcripts.tolist()))
+
+
+def _run_in_thread(func, *args, timeout: float = 5.0):
+    """Call func on a daemon thread, failing the test if it doesn't finish."""
+    result = []
+    thread = threading.Thread(target=lambda: result.append(func(*args)), daemon=True)
+    thread.start()
+    thread.join(timeout)
+    assert not thread.is_alive(), f"{func.__name__} blocked for {timeout}s"
+    return result[0]
+
+
+class _CopiedDatabase(MeetingDatabase):
+    """In-memory database that starts from a copy of an initialized one."""
+
+    def __init__(self, template: MeetingDatabase):
+        self._template = template
+        super().__init__(db_path=":memory:")
+
+    def _init_db(self) -> None:
+        if hasattr(self._conn, "deserialize"):  # Python 3.11+
+            self._conn.deserialize(self._template._conn.serialize())
+        else:
+            self._template._conn.backup(self._conn)
+
+
+class _CountingConnection:
+    """Wraps a connection, recording the SQL passed to execute() and executemany()."""
+
+    def __init__(self, conn: sqlite3.Connection):
+        self._conn = conn
+        self.statements: list[str] = []
+
+    def execute(self, sql: str, *args):
+        self.statements.append(sql)
+        return self._conn.execute(sql, *args)
+
+    def executemany(self, sql: str, *args):
+        self.statements.append(sql)
+        return self._conn.executemany(sql, *args)
+
+    def __getattr__(self, name: str):
+        return getattr(self._conn, name)
+
+    def __enter__(self) -> "_CountingConnection":
+        self._conn.__enter__()
+        return self
+
+    def __exit__(self, *exc_info):
+        return self._conn.__exit__(*exc_info)
+
+
+@pytest.fixture(scope="session")
+def template_db() -> MeetingDatabase:
+    """Create the schema once for every test database to copy."""
+    return MeetingDatabase(db_path=":memory:")
+
+
+@pytest.fixture
+def db(template_db: MeetingDatabase) -> MeetingDatabase:
+    """Create a fresh in-memory database for testing."""
+    return _CopiedDatabase(template_db)
+
+
+@pytest.fixture(scope="module")
+def seeded_db(template_db: MeetingDatabase) -> MeetingDatabase:
+    """Create a small read-only corpus shared by the search tests."""
+    db = _CopiedDatabase(template_db)
+    db.save_meetings([
+        Meeting(title="Python Workshop", transcript="We learned about decorators"),
+        Meeting(title="Sprint Planning", transcript="Assigned tasks"),
+    ])
+    db._conn.execute("PRAGMA query_only=ON")  # a test that writes fails loudly
+    return db
+
+
+@pytest.fixture
+def sql_counter(request: pytest.FixtureRequest) -> Iterator[list[str]]:
+    """Record every SQL statement run on the test's database.
+
+    Traces disk_db if the test uses it, otherwise db. Every connection in
+    the pool is traced, including readers opened while the test runs.
+    """
+    name = "disk_db" if "disk_db" in request.fixturenames else "db"
+    pool = request.getfixturevalue(name)._pool
+    statements: list[str] = []
+    traced = [pool.writer, *(conn for conn in pool._readers.queue if conn is not None)]
+    connect = pool._connect
+
+    def traced_connect(read_only: bool) -> sqlite3.Connection:
+        conn = connect(read_only)
+        traced.append(conn)
+        conn.set_trace_callback(statements.append)
+        return conn
+
+    for conn in traced:
+        conn.set_trace_callback(statements.append)
+    pool._connect = traced_connect
+    yield statements
+    pool._connect = connect
+    for conn in traced:
+        conn.set_trace_callback(None)
+
+
+@pytest.fixture(autouse=True)
+def _fast_sqlite(monkeypatch: pytest.MonkeyPatch) -> None:
+    """With PYTEST_FAST_DB set, don't fsync test databases on commit."""
+    if FAST_DB:
+        monkeypatch.setattr(database, "_PRAGMAS", database._PRAGMAS.replace(
+            "synchronous=NORMAL", "synchronous=OFF"))
+
+
+@pytest.fixture
+def db_dir(tmp_path: Path) -> Iterator[Path]:
+    """Directory for on-disk databases, in tmpfs when PYTEST_FAST_DB is set."""
+    if FAST_DB and Path("/dev/shm").is_dir():
+        with tempfile.TemporaryDirectory(prefix="pytest-", dir="/dev/shm") as path:
+            yield Path(path)
+    else:
+        yield tmp_path
 
 
 @pytest.fixture
-def db(tmp_path: Path) -> MeetingDatabase:
-    """Create a temporary database for testing."""
-    return MeetingDatabase(db_path=str(tmp_path / "test.db"))
+def disk_db(db_dir: Path) -> MeetingDatabase:
+    """Create a temporary on-disk database for tests that need a file."""
+    return MeetingDatabase(db_path=str(db_dir / "test.db"))
 
 
 @pytest.fixture
@@ -45,8 +201,7 @@ class TestMeeting:
 
     def test_validation(self):
         """Test that Pydantic rejects invalid types."""
-        import pydantic
-        with pytest.raises(pydantic.ValidationError):
+        with pytest.raises(pydantic.ValidationError, match="title"):
             Meeting(title=123)  # type: ignore[arg-type]
 
     def test_model_dump(self, sample_meeting: Meeting):
@@ -61,8 +216,12 @@ class TestMeetingDatabase:
     """Tests for the MeetingDatabase class."""
 
     def test_save_and_retrieve(self, db: MeetingDatabase, sample_meeting: Meeting):
+        conn = db._conn = _CountingConnection(db._conn)  # type: ignore[assignment]
         meeting_id = db.save_meeting(sample_meeting)
         assert meeting_id is not None
+        # The new ID comes back with the INSERT; the only other statement
+        # adds the meeting's words to the term index
+        assert conn.statements == [_SQL_INSERT, database._SQL_INSERT_TERM]
 
         retrieved = db.get_meeting(meeting_id)
         assert retrieved is not None
@@ -70,6 +229,20 @@ class TestMeetingDatabase:
         assert retrieved.key_points == [
             "New feature prioritized", "Bug fixes scheduled"]
 
+    def test_list_fields_round_trip(self, db: MeetingDatabase):
+        meeting = Meeting(
+            key_points=['Say "hello"', "Café ☕", "back\\slash"],
+            action_items=[],
+        )
+        meeting_id = db.save_meeting(meeting)
+
+        retrieved = db.get_meeting(meeting_id)
+        assert retrieved.to_dict() == meeting.to_dict()
+        row = db._conn.execute(
+            "SELECT key_points FROM meetings WHERE id = ?", (meeting_id,)
+        ).fetchone()
+        assert json.loads(row["key_points"]) == meeting.key_points
+
     def test_update_meeting(self, db: MeetingDatabase, sample_meeting: Meeting):
         db.save_meeting(sample_meeting)
         sample_meeting.title = "Updated Sprint Planning"
@@ -81,12 +254,145 @@ class TestMeetingDatabase:
         assert retrieved.title == "Updated Sprint Planning"
 
     def test_get_all_meetings(self, db: MeetingDatabase):
-        db.save_meeting(Meeting(title="Meeting 1"))
-        db.save_meeting(Meeting(title="Meeting 2"))
-        db.save_meeting(Meeting(title="Meeting 3"))
+        db.save_meetings([
+            Meeting(title=f"Meeting {i}", date=f"2024-01-0{i} 10:00") for i in (2, 1, 3)
+        ])
 
         meetings = db.get_all_meetings()
-        assert len(meetings) == 3
+        assert [m.title for m in meetings] == ["Meeting 3", "Meeting 2", "Meeting 1"]
+        plan = db._conn.execute(
+            "EXPLAIN QUERY PLAN SELECT id FROM meetings ORDER BY date DESC LIMIT 3"
+        ).fetchall()
+        assert any("idx_meetings_date" in row["detail"] for row in plan)
+
+    def test_save_meetings(self, db: MeetingDatabase, sample_meeting: Meeting):
+        existing_id = db.save_meeting(sample_meeting)
+        sample_meeting.title = "Renamed"
+
+        db.delete_meeting(db.save_meeting(Meeting()))  # IDs are not reused
+
+        ids = db.save_meetings(
+            [Meeting(title="New"), sample_meeting, Meeting(title="Next")])
+        assert ids[1] == existing_id
+        assert db.get_meeting(ids[0]).title == "New"
+        assert db.get_meeting(ids[2]).title == "Next"
+        assert db.get_meeting(existing_id).title == "Renamed"
+
+    def test_save_meetings_commits_once(self, db: MeetingDatabase,
+                                        sql_counter: list[str]):
+        ids = db.save_meetings(Meeting(title=f"Meeting {i}") for i in range(1000))
+
+        assert sql_counter.count("COMMIT") == 1
+        assert len(db.get_all_meetings()) == 1000
+        assert [db.get_meeting(ids[i]).title for i in (0, 499, 999)] == [
+            "Meeting 0", "Meeting 499", "Meeting 999"]
+
+    def test_get_all_meetings_large_table(self, db: MeetingDatabase):
+        db.save_meetings(
+            Meeting(title=f"Meeting {i}", date=f"2024-{i % 12 + 1:02}-01 09:00",
+                    key_points=[f"Point {i}"])
+            for i in range(10_000))
+
+        meetings = db.get_all_meetings()
+        assert len(meetings) == 10_000
+        assert meetings[0].date == "2024-12-01 09:00"
+        assert meetings[-1].date == "2024-01-01 09:00"
+        assert meetings[0].key_points == [f"Point {meetings[0].id - 1}"]
+
+    def test_iter_meetings(self, db: MeetingDatabase, sample_meeting: Meeting):
+        db.save_meeting(Meeting(title="Older", date="2024-01-01 09:00"))
+        sample_meeting.date = "2024-02-01 09:00"
+        db.save_meeting(sample_meeting)
+
+        rows = list(db.iter_meetings())
+        assert [row.title for row in rows] == ["Sprint Planning", "Older"]
+        assert rows[0].key_points == sample_meeting.key_points
+        assert rows[0].to_meeting() == sample_meeting
+
+    def test_iter_meetings_pages(self, db: MeetingDatabase,
+                                 monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.setattr(database, "FETCH_BATCH_SIZE", 3)
+        db.save_meetings(
+            Meeting(title=f"Meeting {i}", date=f"2024-01-0{i % 3 + 1} 09:00")
+            for i in range(10))
+
+        assert [row.id for row in db.iter_meetings()] == [
+            m.id for m in db.get_all_meetings()]
+        assert len({row.id for row in db.iter_meetings()}) == 10
+
+    @pytest.mark.parametrize("fixture", ["db", "disk_db"])
+    def test_half_read_iterators_dont_block(self, request: pytest.FixtureRequest,
+                                            monkeypatch: pytest.MonkeyPatch,
+                                            fixture: str):
+        meeting_db = request.getfixturevalue(fixture)
+        monkeypatch.setattr(database, "FETCH_BATCH_SIZE", 1)
+        meeting_id = meeting_db.save_meeting(Meeting(title="First"))
+        meeting_db.save_meeting(Meeting(title="Second"))
+
+        # More iterators than the pool has read connections
+        iterators = [meeting_db.iter_meetings() for _ in range(5)]
+        _run_in_thread(lambda: [next(rows) for rows in iterators])
+
+        _run_in_thread(meeting_db.save_meeting, Meeting(title="Third"))
+        assert _run_in_thread(meeting_db.get_meeting, meeting_id).title == "First"
+        assert len(list(iterators[0])) == 2
+
+    @pytest.mark.parametrize("read", [
+        lambda db: db.get_all_meetings(),
+        lambda db: list(db.iter_meetings()),
+        lambda db: db.list_meeting_summaries(),
+        lambda db: db.search_meetings("meeting"),
+        lambda db: db.search_meetings("m"),
+        lambda db: db.search_meetings_terms("meeting"),
+    ], ids=["all", "iter", "summaries", "search", "search-short", "terms"])
+    def test_reads_use_one_query(self, db: MeetingDatabase, sql_counter: list[str],
+                                 read):
+        """Reading many meetings doesn't issue a query per meeting."""
+        db.save_meetings(
+            Meeting(title=f"Meeting {i}", key_points=["Point"]) for i in range(100))
+        sql_counter.clear()
+
+        assert len(read(db)) == 100
+        queries = [sql for sql in sql_counter if not sql.startswith("--")]
+        assert len(queries) == 1
+
+    def test_sql_counter_traces_readers(self, disk_db: MeetingDatabase,
+                                        sql_counter: list[str]):
+        disk_db.save_meeting(Meeting(title="Standup"))
+        with disk_db._pool.reader() as conn:
+            assert conn is not disk_db._conn
+        sql_counter.clear()
+
+        assert len(disk_db.get_all_meetings()) == 1
+        assert [sql for sql in sql_counter if not sql.startswith("--")] == [
+            database._SQL_SELECT_ALL]
+
+    def test_list_meeting_summaries(self, db: MeetingDatabase):
+        older_id = db.save_meeting(
+            Meeting(title="Older", date="2024-01-01 09:00", transcript="long text"))
+        newer_id = db.save_meeting(Meeting(title="Newer", date="2024-02-01 09:00"))
+
+        assert db.list_meeting_summaries() == [
+            (newer_id, "Newer"), (older_id, "Older")]
+
+    def test_listing_uses_date_index(self, db: MeetingDatabase):
+        plan = db._conn.execute(
+            "EXPLAIN QUERY PLAN SELECT * FROM meetings ORDER BY date DESC"
+        ).fetchall()
+        assert any("idx_meetings_date" in row["detail"] for row in plan)
+
+    def test_large_batch_refreshes_statistics(self, db: MeetingDatabase):
+        db.save_meetings(
+            Meeting(title=f"Meeting {i}", date=f"2024-01-{i % 28 + 1:02} 10:00")
+            for i in range(1001))
+
+        stats = db._conn.execute(
+            "SELECT stat FROM sqlite_stat1 WHERE idx = 'idx_meetings_date'").fetchone()
+        assert stats is not None
+        plan = db._conn.execute(
+            "EXPLAIN QUERY PLAN SELECT * FROM meetings ORDER BY date DESC LIMIT 20"
+        ).fetchall()
+        assert any("idx_meetings_date" in row["detail"] for row in plan)
 
     def test_delete_meeting(self, db: MeetingDatabase, sample_meeting: Meeting):
         db.save_meeting(sample_meeting)
@@ -98,18 +404,317 @@ class TestMeetingDatabase:
     def test_delete_nonexistent(self, db: MeetingDatabase):
         assert db.delete_meeting(999) is None
 
-    def test_search_meetings(self, db: MeetingDatabase):
-        db.save_meeting(Meeting(title="Python Workshop",
-                        transcript="We learned about decorators"))
-        db.save_meeting(Meeting(title="Sprint Planning",
-                        transcript="Assigned tasks"))
+    def test_delete_meetings(self, db: MeetingDatabase):
+        keep_id = db.save_meeting(Meeting(title="Keep"))
+        first_id = db.save_meeting(Meeting(title="First", audio_path="a.wav"))
+        second_id = db.save_meeting(Meeting(title="Second", audio_path="b.wav"))
+
+        deleted = db.delete_meetings([first_id, second_id, 999])
+        assert deleted == {first_id: "a.wav", second_id: "b.wav"}
+        assert [m.id for m in db.get_all_meetings()] == [keep_id]
+        assert db.delete_meetings([]) == {}
+
+    @pytest.mark.parametrize("query, expected_title", [
+        ("Python", "Python Workshop"),
+        ("tasks", "Sprint Planning"),
+        ("print", "Sprint Planning"),  # substrings inside words match too
+        ("learned DECORATORS", "Python Workshop"),
+    ])
+    def test_search_meetings(self, seeded_db: MeetingDatabase,
+                             query: str, expected_title: str):
+        results = seeded_db.search_meetings(query)
+        assert [m.title for m in results] == [expected_title]
+
+    def test_search_meetings_short_terms(self, db: MeetingDatabase):
+        db.save_meeting(Meeting(title="Q3 Review", summary="Margin up 5%"))
+        db.save_meeting(Meeting(title="Q4 Review", summary="Margin up 50"))
+
+        assert [m.title for m in db.search_meetings("q3")] == ["Q3 Review"]
+        assert [m.title for m in db.search_meetings("5%")] == ["Q3 Review"]
+        assert len(db.search_meetings("review up")) == 2
+
+    def test_search_meetings_ranks_by_relevance(self, db: MeetingDatabase):
+        db.save_meeting(Meeting(title="Standup", transcript="roadmap was mentioned"))
+        db.save_meeting(Meeting(title="Roadmap", transcript="roadmap roadmap roadmap"))
+
+        assert [m.title for m in db.search_meetings("roadmap")] == ["Roadmap", "Standup"]
+
+    def test_search_meetings_with_filters(self, db: MeetingDatabase):
+        db.save_meetings([
+            Meeting(title="Retro", date="2024-01-05 10:00"),
+            Meeting(title="Retro", date="2024-02-05 10:00"),
+            Meeting(title="Retro", date="2024-03-05 10:00"),
+            Meeting(title="Standup", date="2024-02-06 10:00"),
+        ])
+
+        results = db.search_meetings("retro", since="2024-02-01", until="2024-03-01")
+        assert [m.date for m in results] == ["2024-02-05 10:00"]
+        assert len(db.search_meetings("retro", limit=2)) == 2
+        assert len(db.search_meetings("", since="2024-02-01")) == 3
+
+    def test_filtered_search_uses_fts_index(self, db: MeetingDatabase,
+                                            sql_counter: list[str]):
+        db.search_meetings("planning", since="2024-01-01", limit=5)
+
+        sql = next(s for s in sql_counter if "MATCH" in s)
+        plan = db._conn.execute(f"EXPLAIN QUERY PLAN {sql}").fetchall()
+        assert any("VIRTUAL TABLE INDEX" in row["detail"]
+                   and "meetings_fts" in row["detail"] for row in plan)
+
+    def test_search_meetings_large_table(self, db: MeetingDatabase,
+                                         sql_counter: list[str]):
+        db.save_meetings(
+            Meeting(title=f"Meeting {i}", transcript=f"Discussion number {i} of many")
+            for i in range(10_000))
+        sql_counter.clear()
+
+        results = db.search_meetings("number 4321 ")
+        assert [m.title for m in results] == ["Meeting 4321"]
+
+        # An index lookup rather than a scan of every transcript
+        sql = next(s for s in sql_counter if "MATCH" in s)
+        plan = db._conn.execute(f"EXPLAIN QUERY PLAN {sql}").fetchall()
+        assert any("VIRTUAL TABLE INDEX" in row["detail"]
+                   and "meetings_fts" in row["detail"] for row in plan)
+        assert not any(row["detail"] == "SCAN m" for row in plan)
+
+    def test_search_meetings_prefix_and_punctuation(self, db: MeetingDatabase):
+        db.save_meeting(Meeting(title="Budget Review",
+                        summary="Finance approved the Q3 budget"))
+
+        assert len(db.search_meetings("fin")) == 1
+        assert len(db.search_meetings('approved "Q3"')) == 1
+        assert db.search_meetings("marketing") == []
+
+    def test_search_meetings_terms(self, db: MeetingDatabase):
+        roadmap_id = db.save_meeting(Meeting(
+            title="Roadmap Review", transcript="Um, we agreed the Q3 roadmap is final."))
+        budget_id = db.save_meeting(Meeting(
+            title="Budget", transcript="The roadmap needs more budget in 2025."))
+
+        assert db.search_meetings_terms("roadmap") == [budget_id, roadmap_id]
+        assert db.search_meetings_terms("Roadmap, FINAL!") == [roadmap_id]
+        # Whole words only; stop words, filler and numbers aren't indexed
+        assert db.search_meetings_terms("road") == []
+        assert db.search_meetings_terms("the um 2025") == []
+
+    def test_search_meetings_terms_follows_changes(self, db: MeetingDatabase,
+                                                   sample_meeting: Meeting):
+        meeting_id = db.save_meeting(sample_meeting)
+        sample_meeting.transcript = "Retrospective notes"
+        db.save_meetings([sample_meeting])
+
+        assert db.search_meetings_terms("goals") == []
+        assert db.search_meetings_terms("retrospective") == [meeting_id]
+
+        db.delete_meeting(meeting_id)
+        assert db.search_meetings_terms("retrospective") == []
+        assert db._conn.execute("SELECT COUNT(*) FROM meeting_terms").fetchone()[0] == 0
+
+        # Updating a meeting that doesn't exist indexes nothing
+        db.save_meeting(Meeting(id=999, title="Ghost"))
+        db.save_meetings([Meeting(id=998, title="Phantom")])
+        assert db.search_meetings_terms("ghost") == []
+        assert db.search_meetings_terms("phantom") == []
 
-        results = db.search_meetings("Python")
-        assert len(results) == 1
-        assert results[0].title == "Python Workshop"
+    def test_other_clients_can_write(self, disk_db: MeetingDatabase,
+                                     db_dir: Path):
+        """The schema needs no Python functions, so plain SQLite can still write."""
+        disk_db.save_meeting(Meeting(title="Budget"))
+        # A trigger like those an earlier version created is removed on open
+        disk_db._conn.execute("""
+            CREATE TRIGGER meeting_terms_insert AFTER INSERT ON meetings BEGIN
+                SELECT meeting_terms(new.title, new.transcript);
+            END
+        """)
+        disk_db.close()
+        MeetingDatabase(db_path=db_dir / "test.db").close()
 
-        results = db.search_meetings("tasks")
-        assert len(results) == 1
+        with sqlite3.connect(db_dir / "test.db") as conn:
+            conn.execute(
+                "INSERT INTO meetings (title, date) VALUES ('Offsite', '2024-01-01')")
+            conn.execute("UPDATE meetings SET transcript = 'notes'")
+            conn.execute("DELETE FROM meetings WHERE title = 'Budget'")
+            assert conn.execute("SELECT COUNT(*) FROM meeting_terms").fetchone()[0] == 0
+
+    def test_search_meetings_terms_non_ascii(self, db: MeetingDatabase):
+        meeting_id = db.save_meeting(Meeting(
+            title="Zürich offsite", transcript="Coffee at the café, then snake_case review"))
+
+        assert db.search_meetings_terms("zürich CAFÉ") == [meeting_id]
+        assert db.search_meetings_terms("rich") == []
+        assert db.search_meetings_terms("caf") == []
+        assert db.search_meetings_terms("snake") == [meeting_id]
+
+    def test_search_meetings_terms_large_table(self, db: MeetingDatabase,
+                                               sql_counter: list[str]):
+        db.save_meetings(
+            Meeting(title=f"Meeting {i}", transcript=f"topic{i % 500} status update")
+            for i in range(10_000))
+        sql_counter.clear()
+
+        assert len(db.search_meetings_terms("topic123")) == 20
+
+        # A primary key lookup per term rather than a scan of the index
+        sql = next(s for s in sql_counter if "meeting_terms" in s)
+        plan = db._conn.execute(f"EXPLAIN QUERY PLAN {sql}").fetchall()
+        assert any("meeting_terms USING PRIMARY KEY (term=?)" in row["detail"]
+                   for row in plan)
+
+    def test_search_indexes_existing_meetings(self, db_dir: Path):
+        """Meetings saved before the FTS index existed are still searchable."""
+        db_path = db_dir / "legacy.db"
+        with sqlite3.connect(db_path) as conn:
+            conn.execute("""
+                CREATE TABLE meetings (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    title TEXT NOT NULL DEFAULT 'Untitled Meeting',
+                    date TEXT NOT NULL,
+                    transcript TEXT DEFAULT '',
+                    summary TEXT DEFAULT '',
+                    key_points TEXT DEFAULT '[]',
+                    action_items TEXT DEFAULT '[]',
+                    audio_path TEXT DEFAULT ''
+                )
+            """)
+            conn.execute(
+                "INSERT INTO meetings (title, date) VALUES ('Legacy Sync', '2024-01-01 10:00')")
+
+        db = MeetingDatabase(db_path=str(db_path))
+        results = db.search_meetings("legacy")
+        assert [m.title for m in results] == ["Legacy Sync"]
+        assert results[0].audio_hash is None
+        assert db.search_meetings_terms("sync") == [results[0].id]
+
+    def test_search_upgrades_word_index(self, db_dir: Path):
+        """A word-tokenized index from an earlier version is rebuilt."""
+        db_path = db_dir / "words.db"
+        MeetingDatabase(db_path=str(db_path)).save_meeting(
+            Meeting(title="Onboarding"))
+        with sqlite3.connect(db_path) as conn:
+            conn.execute("DROP TABLE meetings_fts")
+            conn.execute("""
+                CREATE VIRTUAL TABLE meetings_fts USING fts5(
+                    title, transcript, summary,
+                    content='meetings', content_rowid='id'
+                )
+            """)
+
+        db = MeetingDatabase(db_path=str(db_path))
+        assert [m.title for m in db.search_meetings("board")] == ["Onboarding"]
+
+    def test_old_sqlite_is_rejected(self, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.setattr(sqlite3, "sqlite_version_info", (3, 31, 1))
+        with pytest.raises(RuntimeError, match="SQLite 3.34.0 or newer"):
+            MeetingDatabase(db_path=":memory:")
 
     def test_get_nonexistent_meeting(self, db: MeetingDatabase):
         assert db.get_meeting(999) is None
+
+    def test_get_meeting_by_hash(self, db: MeetingDatabase):
+        meeting_id = db.save_meeting(Meeting(title="Upload", audio_hash="abc123"))
+        db.save_meeting(Meeting(title="Recording"))
+        db.save_meeting(Meeting(title="Recording"))
+
+        found = db.get_meeting_by_hash("abc123")
+        assert found is not None
+        assert found.id == meeting_id
+        assert db.get_meeting_by_hash("missing") is None
+
+        with pytest.raises(sqlite3.IntegrityError):
+            db.save_meeting(Meeting(title="Duplicate", audio_hash="abc123"))
+
+    def test_access_from_another_thread(self, disk_db: MeetingDatabase):
+        """The shared connection can be used from Streamlit's script threads."""
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            list(executor.map(
+                lambda i: disk_db.save_meeting(Meeting(title=f"Meeting {i}")), range(10)))
+
+        assert len(disk_db.get_all_meetings()) == 10
+
+    def test_concurrent_reads_and_writes(self, disk_db: MeetingDatabase):
+        """Readers on their own connections run alongside the writer."""
+        def work(i: int) -> None:
+            if i % 11 == 0:
+                disk_db.save_meeting(Meeting(title=f"Meeting {i}", transcript="notes"))
+            elif i % 3 == 0:
+                disk_db.search_meetings("notes")
+            else:
+                disk_db.list_meeting_summaries()
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(work, range(1100)))  # re-raises any SQLITE_BUSY
+
+        assert len(disk_db.get_all_meetings()) == 100
+
+    def test_read_connections_are_read_only(self, disk_db: MeetingDatabase):
+        with disk_db._pool.reader() as conn:
+            assert conn is not disk_db._conn
+            with pytest.raises(sqlite3.OperationalError, match="readonly"):
+                conn.execute("DELETE FROM meetings")
+
+    def test_close_with_borrowed_reader(self, disk_db: MeetingDatabase):
+        with disk_db._pool.reader() as conn:
+            disk_db.close()
+            conn.execute("SELECT 1")  # still usable until it is returned
+        with pytest.raises(sqlite3.ProgrammingError):
+            conn.execute("SELECT 1")
+        with pytest.raises(sqlite3.ProgrammingError, match="closed"):
+            disk_db.get_meeting(1)
+
+    def test_pragmas_applied(self, disk_db: MeetingDatabase):
+        conn = disk_db._conn
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        synchronous = 0 if FAST_DB else 1  # OFF / NORMAL
+        assert conn.execute("PRAGMA synchronous").fetchone()[0] == synchronous
+        assert conn.execute("PRAGMA busy_timeout").fetchone()[0] == 5000
+
+    @pytest.mark.parametrize("uri", [
+        "file:shared_test?mode=memory&cache=shared",
+        "file::memory:?cache=shared",
+    ])
+    def test_shared_memory_uri(self, uri: str):
+        first = MeetingDatabase(db_path=uri)
+        second = MeetingDatabase(db_path=uri)
+
+        meeting_id = first.save_meeting(Meeting(title="Shared"))
+        assert second.get_meeting(meeting_id).title == "Shared"
+        assert second._conn.execute("PRAGMA journal_mode").fetchone()[0] == "memory"
+        # Shared-cache readers would hit table locks that busy_timeout can't wait out
+        with second._pool.reader() as conn:
+            assert conn is second._conn
+        first.close()
+        second.close()
+
+    def test_path_object(self, db_dir: Path):
+        db = MeetingDatabase(db_path=db_dir / "path.db")
+        meeting_id = db.save_meeting(Meeting(title="From a Path"))
+        assert db.get_meeting(meeting_id).title == "From a Path"
+
+    def test_meetings_persist_after_reopen(self, disk_db: MeetingDatabase,
+                                           sample_meeting: Meeting):
+        meeting_id = disk_db.save_meeting(sample_meeting)
+        disk_db.close()
+
+        reopened = MeetingDatabase(db_path=str(disk_db.db_path))
+        assert reopened.get_meeting(meeting_id) == sample_meeting
+        assert reopened.search_meetings("sprint")[0].id == meeting_id
+
+    @pytest.mark.slow
+    def test_bulk_load_benchmark(self, disk_db: MeetingDatabase):
+        meetings = [Meeting(title=title, date=date, transcript=transcript)
+                    for title, date, transcript in _gen_rows(100_000)]
+
+        start = time.perf_counter()
+        disk_db.save_meetings(meetings)
+        rows_per_second = len(meetings) / (time.perf_counter() - start)
+
+        # One WAL transaction that also updates the trigram and term indexes
+        # through their triggers, and refreshes the planner statistics
+        assert rows_per_second > 2_000
+        assert len(disk_db.list_meeting_summaries()) == 100_000
+        titles = [m.title for m in disk_db.search_meetings("4242")]
+        assert "Meeting 4242" in titles
+        assert all("4242" in title for title in titles)
+        assert len(disk_db.search_meetings_terms("roadmap budget")) == sum(
+            {"roadmap", "budget"} <= set(m.transcript.split()) for m in meetings)
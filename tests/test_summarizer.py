@@ -0,0 +1,95 @@
+"""Tests for the Summarizer module."""
+
+from pathlib import Path
+
+import pytest  # type: ignore[import-untyped]
+
+from meeting_assistant import summarizer
+from meeting_assistant.summarizer import Summarizer
+
+
+class _CharEncoding:
+    """One token per character, so token counts are easy to reason about."""
+
+    def encode(self, text: str) -> list[str]:
+        return list(text)
+
+    def decode(self, tokens: list[str]) -> str:
+        return "".join(tokens)
+
+
+@pytest.fixture
+def char_encoding(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Measure transcripts in characters instead of tiktoken tokens."""
+    monkeypatch.setattr(summarizer, "_encoding", _CharEncoding)
+
+
+@pytest.fixture
+def llm(tmp_path: Path) -> Summarizer:
+    """Create a summarizer whose response cache lives in a temporary directory."""
+    return Summarizer(base_url="http://localhost:1/v1", model="test",
+                      cache_dir=str(tmp_path))
+
+
+class TestTokenBudget:
+    """Tests for splitting and truncating transcripts by token count."""
+
+    @pytest.mark.parametrize("length, expected_starts", [
+        (0, []),
+        (10, [0]),         # exactly max_tokens fits in one chunk
+        (11, [0, 7]),      # one token over: a second chunk with the overlap
+        (17, [0, 7]),      # the last chunk ends exactly at the end
+        (18, [0, 7, 14]),  # one token past a step boundary
+    ])
+    def test_chunk_transcript(self, llm: Summarizer, char_encoding,
+                              length: int, expected_starts: list[int]):
+        text = "".join(chr(ord("a") + i % 26) for i in range(length))
+
+        chunks = llm._chunk_transcript(text, max_tokens=10, overlap=3)
+
+        assert [text.index(chunk) for chunk in chunks] == expected_starts
+        assert all(len(chunk) <= 10 for chunk in chunks)
+        if chunks:
+            assert chunks[-1] == text[expected_starts[-1]:]
+            rebuilt = chunks[0] + "".join(chunk[3:] for chunk in chunks[1:])
+            assert rebuilt == text
+
+    @pytest.mark.parametrize("length, expected_length", [
+        (0, 0), (9, 9), (10, 10), (11, 10)])
+    def test_truncate(self, char_encoding, length: int, expected_length: int):
+        text = "x" * length
+        assert Summarizer._truncate(text, max_tokens=10) == "x" * expected_length
+
+    def test_encoding_falls_back_offline(self, monkeypatch: pytest.MonkeyPatch):
+        def offline(name: str):
+            raise ConnectionError("no network")
+
+        monkeypatch.setattr(summarizer.tiktoken, "get_encoding", offline)
+        summarizer._encoding.cache_clear()
+        try:
+            enc = summarizer._encoding()
+            text = "Um, we agreed  the Q3 roadmap is final.\n"
+            assert enc.decode(enc.encode(text)) == text
+            assert len(enc.encode(text)) >= len(text.split())
+            assert Summarizer._truncate(text, max_tokens=3) == "Um, we agre"
+        finally:
+            summarizer._encoding.cache_clear()
+
+
+class TestExtractItems:
+    """Tests for parsing JSON-mode key point and action item replies."""
+
+    @pytest.mark.parametrize("reply, expected", [
+        ('{"items": ["First", " Second "]}', ["First", "Second"]),
+        ('{"items": ["a", null, 3, {"text": "b"}, ["c"], ""]}', ["a"]),
+        ('{"key_points": ["Under another key"]}', ["Under another key"]),
+        ('["A bare list"]', ["A bare list"]),
+        ('{"summary": "text", "points": ["ambiguous"]}', []),
+        ('{"items": "not a list"}', []),
+        ("Sure! Here are the points:", []),
+    ])
+    def test_extract_items(self, llm: Summarizer, char_encoding,
+                           monkeypatch: pytest.MonkeyPatch,
+                           reply: str, expected: list[str]):
+        monkeypatch.setattr(llm, "_chat", lambda *args, **kwargs: reply)
+        assert llm.extract_key_points("transcript") == expected